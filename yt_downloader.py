@@ -9,23 +9,75 @@ import subprocess
 import re
 import os
 from pathlib import Path
-from datetime import datetime
 from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 import argparse
 import sys
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Prefixes for the lines yt-dlp prints via --print during a download
+TITLE_MARKER = "TITLE:"
+PATH_MARKER = "FILEPATH:"
+DONE_MARKER = "DONE:"
+
+# INSERT ... RETURNING needs SQLite 3.35+; chunks stay under the variable limit
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+INSERT_CHUNK_SIZE = 500
+
+VIDEO_ID_RE = re.compile(r"v=([a-zA-Z0-9_-]{11})")
+LIST_PARAM_RE = re.compile(r"&list=.*")
+YTDLP_ERROR_RE = re.compile(r"ERROR: \[[^\]]+\] ([a-zA-Z0-9_-]{11}): ")
+INVALID_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*')
 
 
 class YTDownloader:
-    def __init__(self, db_path="database.sqlite", download_dir="downloads"):
+    def __init__(
+        self, db_path="database.sqlite", download_dir="downloads", concurrent_fragments=4
+    ):
         self.db_path = db_path
         self.download_dir = Path(download_dir)
+        self.concurrent_fragments = concurrent_fragments
         self.download_dir.mkdir(exist_ok=True)
+        # One connection for the lifetime of the downloader; autocommit mode,
+        # multi-statement writes open their own transaction explicitly
+        self.conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        # Serializes access to the shared connection from download workers
+        self._db_lock = threading.Lock()
+        # Playwright and Chromium are started lazily and shared across scrapes
+        self._pw = None
+        self._browser = None
         self._init_db()
 
+    def close(self):
+        """Close the browser (if started) and the database connection"""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _init_db(self):
         """Initialize SQLite database with videos table"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA temp_store=MEMORY")
+        c.execute("PRAGMA cache_size=-65536")
         c.execute("""
             CREATE TABLE IF NOT EXISTS videos (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -41,115 +93,217 @@ class YTDownloader:
                 error_msg TEXT
             )
         """)
-        conn.commit()
-        conn.close()
+        # Covering index for get_pending_videos; also serves status-only filters
+        c.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_status_channel
+            ON videos(status, channel_url, video_url, video_id)
+        """)
+        # Per-channel lookup in add_videos_to_db; index entries end with the
+        # rowid, so rows come back in id order without a sort
+        c.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos(channel_url)
+        """)
+
+    def _get_page(self):
+        """Return a page in a fresh context of the shared headless browser"""
+        if self._browser is None:
+            pw = sync_playwright().start()
+            try:
+                browser = pw.chromium.launch(headless=True)
+            except Exception:
+                pw.stop()
+                raise
+            self._pw, self._browser = pw, browser
+        return self._browser.new_context().new_page()
 
     def scrape_channel_videos(self, channel_url):
-        """Scrape all video URLs from a YouTube channel using Playwright"""
+        """Scrape all (video_url, video_id) pairs from a YouTube channel using Playwright"""
         print(f"[*] Scraping videos from: {channel_url}")
         video_urls = []
+        seen_ids = set()
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            try:
-                page.goto(channel_url, wait_until="networkidle", timeout=30000)
+        page = self._get_page()
+        try:
+            # YouTube never goes network-idle; wait for the video grid instead
+            page.goto(channel_url, wait_until="domcontentloaded", timeout=15000)
+            page.wait_for_selector("a#video-title-link", timeout=10000)
+
+            # Scroll to load all videos; wait only until the page grows and
+            # stop once no new content arrives within the timeout
+            while True:
+                prev_height = page.evaluate(
+                    """() => {
+                        const height = document.documentElement.scrollHeight;
+                        window.scrollTo(0, height);
+                        return height;
+                    }"""
+                )
+                try:
+                    page.wait_for_function(
+                        "h => document.documentElement.scrollHeight > h",
+                        arg=prev_height,
+                        timeout=5000,
+                    )
+                except PlaywrightTimeoutError:
+                    break
 
-                # Scroll to load all videos
-                prev_height = 0
-                while True:
-                    page.evaluate(
-                        "window.scrollTo(0, document.documentElement.scrollHeight)"
+            # Extract video links in a single round trip to the browser
+            hrefs = page.eval_on_selector_all(
+                "a#video-title-link", "els => els.map(e => e.getAttribute('href'))"
+            )
+            for href in hrefs:
+                if href and "/watch?v=" in href:
+                    full_url = (
+                        f"https://www.youtube.com{href}"
+                        if href.startswith("/")
+                        else href
                     )
-                    page.wait_for_timeout(2000)
-                    new_height = page.evaluate("document.documentElement.scrollHeight")
-                    if new_height == prev_height:
-                        break
-                    prev_height = new_height
-
-                # Extract video links
-                links = page.query_selector_all("a#video-title-link")
-                for link in links:
-                    href = link.get_attribute("href")
-                    if href and "/watch?v=" in href:
-                        full_url = (
-                            f"https://www.youtube.com{href}"
-                            if href.startswith("/")
-                            else href
-                        )
-                        # Clean URL (remove playlist params, etc)
-                        full_url = re.sub(r"&list=.*", "", full_url)
-                        video_urls.append(full_url)
+                    # Clean URL (remove playlist params, etc)
+                    full_url = LIST_PARAM_RE.sub("", full_url)
+                    # Deduplicate on the 11-char video ID, keeping order
+                    match = VIDEO_ID_RE.search(full_url)
+                    if match and match.group(1) not in seen_ids:
+                        seen_ids.add(match.group(1))
+                        video_urls.append((full_url, match.group(1)))
 
-                video_urls = list(set(video_urls))  # Remove duplicates
-                print(f"[+] Found {len(video_urls)} videos")
+            print(f"[+] Found {len(video_urls)} videos")
 
-            except Exception as e:
-                print(f"[-] Error scraping channel: {e}")
-            finally:
-                browser.close()
+        except Exception as e:
+            print(f"[-] Error scraping channel: {e}")
+        finally:
+            page.context.close()
 
         return video_urls
 
     def scrape_playlist_videos(self, playlist_url):
-        """Scrape all video URLs from a YouTube playlist using yt-dlp."""
+        """Scrape all (video_url, video_id) pairs from a YouTube playlist using yt-dlp."""
         print(f"[*] Scraping videos from playlist: {playlist_url}")
         video_urls = []
+        command = ["yt-dlp", "--print", "id", "--flat-playlist", playlist_url]
         try:
-            command = ["yt-dlp", "--print", "id", "--flat-playlist", playlist_url]
-            result = subprocess.run(
-                command, capture_output=True, text=True, check=True, timeout=60
-            )
-            video_ids = result.stdout.strip().split("\n")
-            video_urls = [
-                f"https://www.youtube.com/watch?v={vid_id}"
-                for vid_id in video_ids
-                if vid_id
-            ]
+            with tempfile.TemporaryFile() as stderr:
+                process = subprocess.Popen(
+                    command, stdout=subprocess.PIPE, stderr=stderr, text=True
+                )
+                # Kill yt-dlp if it is still running when the timeout expires
+                timed_out = threading.Event()
+
+                def kill_on_timeout():
+                    if process.poll() is None:
+                        timed_out.set()
+                        process.kill()
+
+                timer = threading.Timer(60, kill_on_timeout)
+                timer.start()
+                try:
+                    # Build the list line by line instead of buffering stdout
+                    for line in process.stdout:
+                        vid_id = line.strip()
+                        if vid_id:
+                            video_urls.append(
+                                (f"https://www.youtube.com/watch?v={vid_id}", vid_id)
+                            )
+                    process.wait()
+                finally:
+                    timer.cancel()
+                    self._stop_process(process)
+
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(command, 60)
+                if process.returncode != 0:
+                    stderr.seek(0)
+                    raise subprocess.CalledProcessError(
+                        process.returncode,
+                        command,
+                        stderr=stderr.read().decode("utf-8", "replace"),
+                    )
             print(f"[+] Found {len(video_urls)} videos in playlist.")
         except subprocess.CalledProcessError as e:
+            video_urls = []
             print(f"[-] Error scraping playlist: {e.stderr}")
         except subprocess.TimeoutExpired:
+            video_urls = []
             print("[-] Playlist scraping timed out.")
         except Exception as e:
+            video_urls = []
             print(f"[-] An unexpected error occurred: {e}")
         return video_urls
 
-    def add_videos_to_db(self, video_urls, channel_url):
-        """Add scraped video URLs to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-
-        added = 0
-        for url in video_urls:
-            video_id = self._extract_video_id(url)
-            try:
-                c.execute(
+    def add_videos_to_db(self, videos, channel_url):
+        """Add scraped (video_url, video_id) pairs to database
+
+        Returns the pending (id, video_url, video_id) rows for channel_url,
+        so callers that download right after scraping need not query again.
+        """
+        c = self.conn.cursor()
+
+        # Skip videos already known for this channel before touching the table
+        existing = set()
+        pending = []
+        for db_id, url, video_id, status in c.execute(
+            "SELECT id, video_url, video_id, status FROM videos "
+            "WHERE channel_url=? ORDER BY id",
+            (channel_url,),
+        ):
+            existing.add(video_id)
+            if status == "pending":
+                pending.append((db_id, url, video_id))
+        rows = [
+            (url, video_id, channel_url)
+            for url, video_id in dict.fromkeys(videos)
+            if video_id not in existing
+        ]
+        if not rows:
+            print("[+] Added 0 new videos to database")
+            return pending
+
+        # Single transaction; remaining duplicates (e.g. the same video under
+        # another channel) are skipped by INSERT OR IGNORE
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            if HAS_RETURNING:
+                # executemany discards RETURNING rows, so insert in multi-row chunks
+                added = 0
+                for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                    chunk = rows[start : start + INSERT_CHUNK_SIZE]
+                    values = ", ".join(["(?, ?, ?, 'pending')"] * len(chunk))
+                    c.execute(
+                        f"""
+                        INSERT OR IGNORE INTO videos (video_url, video_id, channel_url, status)
+                        VALUES {values}
+                        RETURNING id, video_url, video_id
+                    """,
+                        [value for row in chunk for value in row],
+                    )
+                    inserted = c.fetchall()
+                    pending.extend(inserted)
+                    added += len(inserted)
+            else:
+                c.executemany(
                     """
-                    INSERT INTO videos (video_url, video_id, channel_url, status)
+                    INSERT OR IGNORE INTO videos (video_url, video_id, channel_url, status)
                     VALUES (?, ?, ?, 'pending')
                 """,
-                    (url, video_id, channel_url),
+                    rows,
                 )
-                added += 1
-            except sqlite3.IntegrityError:
-                pass  # Already exists
-
-        conn.commit()
-        conn.close()
+                added = c.rowcount
+            c.execute("COMMIT")
+        except Exception:
+            c.execute("ROLLBACK")
+            raise
         print(f"[+] Added {added} new videos to database")
-        return added
+        if not HAS_RETURNING:
+            pending = self.get_pending_videos(channel_url=channel_url)
+        return pending
 
     def _extract_video_id(self, url):
         """Extract video ID from YouTube URL"""
-        match = re.search(r"v=([a-zA-Z0-9_-]{11})", url)
+        match = VIDEO_ID_RE.search(url)
         return match.group(1) if match else None
 
     def get_pending_videos(self, channel_url=None):
         """Get all pending videos from database, optionally filtered by channel/playlist URL"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
         if channel_url:
             c.execute(
                 "SELECT id, video_url, video_id FROM videos WHERE status='pending' AND channel_url=?",
@@ -159,45 +313,44 @@ class YTDownloader:
             c.execute(
                 "SELECT id, video_url, video_id FROM videos WHERE status='pending'"
             )
-        videos = c.fetchall()
-        conn.close()
-        return videos
+        return c.fetchall()
 
     def download_video(self, video_id, video_url, custom_name=None, use_title=True):
         """Download video using yt-dlp with live progress output"""
+        process = None
         try:
-            # Get video info first
-            print(f"[*] Fetching video information...")
-            info_cmd = ["yt-dlp", "--print", "title", video_url]
-            result = subprocess.run(
-                info_cmd, capture_output=True, text=True, timeout=30
-            )
-            title = (
-                result.stdout.strip() if result.returncode == 0 else f"video_{video_id}"
-            )
-
-            # Sanitize filename
+            # Output template; "%" in literal parts must be escaped for yt-dlp
+            output_dir = str(self.download_dir).replace("%", "%%")
             if custom_name:
-                filename = self._sanitize_filename(custom_name)
+                filename = self._sanitize_filename(custom_name).replace("%", "%%")
+                output_template = os.path.join(output_dir, f"{filename}.mp4")
             elif use_title:
-                filename = self._sanitize_filename(title)
+                # Let yt-dlp sanitize and truncate the title itself
+                output_template = os.path.join(output_dir, "%(title).200B.%(ext)s")
             else:
-                filename = video_id
-
-            output_path = self.download_dir / f"{filename}.mp4"
+                output_template = os.path.join(output_dir, f"{video_id}.mp4")
 
             # Download video with live output
             print(f"\n{'=' * 80}")
-            print(f"[*] Downloading: {title}")
-            print(f"[*] Output: {output_path}")
+            print(f"[*] Downloading: {video_url}")
             print(f"{'=' * 80}\n")
 
+            # Title and final path are reported by the same yt-dlp run, so no
+            # separate metadata probe is needed
             cmd = [
                 "yt-dlp",
                 "-f",
                 "mp4",
                 "-o",
-                str(output_path),
+                output_template,
+                "--print",
+                f"before_dl:{TITLE_MARKER}%(title)s",
+                "--print",
+                f"after_move:{PATH_MARKER}%(filepath)s",
+                "--concurrent-fragments",
+                str(self.concurrent_fragments),
+                "--http-chunk-size",
+                "10M",
                 "--progress",
                 "--newline",
                 video_url,
@@ -208,28 +361,39 @@ class YTDownloader:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
+                bufsize=64 * 1024,
             )
 
-            # Stream output in real-time
-            output_lines = []
-            for line in process.stdout:
-                print(line, end="")
-                output_lines.append(line)
+            # Stream raw output in real-time, keeping only the tail for errors
+            title = f"video_{video_id}"
+            output_path = None
+            output_tail = deque(maxlen=10)
+            title_marker = TITLE_MARKER.encode()
+            path_marker = PATH_MARKER.encode()
+            sys.stdout.flush()
+            for raw in iter(process.stdout.readline, b""):
+                if raw.startswith(title_marker):
+                    title = self._decode_output(raw[len(title_marker) :])
+                    print(f"[*] Title: {title}", flush=True)
+                    continue
+                if raw.startswith(path_marker):
+                    output_path = self._decode_output(raw[len(path_marker) :])
+                    continue
+                self._echo_output(raw)
+                output_tail.append(raw)
 
             process.wait()
 
             if process.returncode == 0:
                 self._update_video_status(
-                    video_url, "completed", str(output_path), title, custom_name
+                    video_url, "completed", output_path, title, custom_name
                 )
                 print(f"\n{'=' * 80}")
                 print(f"[+] Successfully downloaded: {output_path}")
                 print(f"{'=' * 80}\n")
-                return True, str(output_path)
+                return True, output_path
             else:
-                error = "".join(output_lines[-10:])[:500]
+                error = self._decode_output(b"".join(output_tail))[:500]
                 self._update_video_status(video_url, "failed", error_msg=error)
                 print(f"\n{'=' * 80}")
                 print(f"[-] Download failed")
@@ -237,20 +401,40 @@ class YTDownloader:
                 print(f"{'=' * 80}\n")
                 return False, error
 
-        except subprocess.TimeoutExpired:
-            error = "Download timeout"
-            self._update_video_status(video_url, "failed", error_msg=error)
-            print(f"\n[-] {error}")
-            return False, error
         except Exception as e:
+            self._stop_process(process)
             error = str(e)[:500]
             self._update_video_status(video_url, "failed", error_msg=error)
             print(f"\n[-] Error: {error}")
             return False, error
 
+    @staticmethod
+    def _echo_output(raw):
+        """Pass a raw line of yt-dlp output straight through to stdout"""
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            # stdout replaced by a plain text stream
+            sys.stdout.write(raw.decode("utf-8", "replace"))
+            sys.stdout.flush()
+            return
+        buffer.write(raw)
+        buffer.flush()
+
+    @staticmethod
+    def _stop_process(process):
+        """Kill a yt-dlp child left running after an error and reap it"""
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    @staticmethod
+    def _decode_output(raw):
+        """Decode yt-dlp output bytes, dropping the trailing newline"""
+        return raw.decode("utf-8", "replace").rstrip("\r\n")
+
     def _sanitize_filename(self, filename):
         """Sanitize filename for filesystem"""
-        filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+        filename = filename.translate(INVALID_FILENAME_CHARS)
         filename = filename.strip()
         return filename[:200]  # Limit length
 
@@ -264,30 +448,56 @@ class YTDownloader:
         error_msg=None,
     ):
         """Update video status in database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        with self._db_lock:
+            c = self.conn.cursor()
 
-        if status == "completed":
-            c.execute(
-                """
-                UPDATE videos 
-                SET status=?, download_path=?, title=?, custom_filename=?, downloaded_at=?
-                WHERE video_url=?
-            """,
-                (status, download_path, title, custom_name, datetime.now(), video_url),
-            )
-        else:
-            c.execute(
-                """
-                UPDATE videos 
-                SET status=?, error_msg=?
-                WHERE video_url=?
-            """,
-                (status, error_msg, video_url),
-            )
+            if status == "completed":
+                c.execute(
+                    """
+                    UPDATE videos 
+                    SET status=?, download_path=?, title=?, custom_filename=?,
+                        downloaded_at=CURRENT_TIMESTAMP
+                    WHERE video_url=?
+                """,
+                    (status, download_path, title, custom_name, video_url),
+                )
+            else:
+                c.execute(
+                    """
+                    UPDATE videos 
+                    SET status=?, error_msg=?
+                    WHERE video_url=?
+                """,
+                    (status, error_msg, video_url),
+                )
 
-        conn.commit()
-        conn.close()
+    def _update_video_statuses(self, completed, failed):
+        """Mark many videos completed/failed in a single transaction
+
+        completed holds (download_path, title, video_url) tuples and failed
+        holds (error_msg, video_url) tuples.
+        """
+        with self._db_lock:
+            c = self.conn.cursor()
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                c.executemany(
+                    """
+                    UPDATE videos
+                    SET status='completed', download_path=?, title=?,
+                        downloaded_at=CURRENT_TIMESTAMP
+                    WHERE video_url=?
+                """,
+                    completed,
+                )
+                c.executemany(
+                    "UPDATE videos SET status='failed', error_msg=? WHERE video_url=?",
+                    failed,
+                )
+                c.execute("COMMIT")
+            except Exception:
+                c.execute("ROLLBACK")
+                raise
 
     def download_all_pending(
         self,
@@ -295,9 +505,16 @@ class YTDownloader:
         interactive=False,
         channel_url=None,
         skip_confirmation=False,
+        jobs=1,
+        videos=None,
     ):
-        """Download all pending videos, optionally filtered by channel/playlist URL"""
-        videos = self.get_pending_videos(channel_url=channel_url)
+        """Download all pending videos, optionally filtered by channel/playlist URL
+
+        videos may hold pending (id, video_url, video_id) rows already at hand,
+        e.g. from add_videos_to_db, to skip querying the database again.
+        """
+        if videos is None:
+            videos = self.get_pending_videos(channel_url=channel_url)
 
         if not videos:
             print("[!] No pending videos to download")
@@ -312,31 +529,142 @@ class YTDownloader:
                 print("[-] Download aborted.")
                 return
 
-        for idx, (db_id, url, vid_id) in enumerate(videos, 1):
-            print(f"\n[{idx}/{len(videos)}] Processing: {url}")
+        if interactive:
+            if jobs > 1:
+                print("[!] Interactive mode: downloading one video at a time")
+            for idx, (db_id, url, vid_id) in enumerate(videos, 1):
+                print(f"\n[{idx}/{len(videos)}] Processing: {url}")
 
-            custom_name = None
-            if interactive:
+                custom_name = None
                 choice = input("Use video title as filename? (y/n/custom): ").lower()
                 if choice == "n":
                     use_title = False
                 elif choice == "custom":
                     custom_name = input("Enter custom filename (without extension): ")
 
-            self.download_video(vid_id, url, custom_name, use_title)
+                self.download_video(vid_id, url, custom_name, use_title)
+            return
 
-    def list_videos(self, status=None):
-        """List videos from database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        # One yt-dlp process per batch instead of one per video; batches run
+        # in parallel threads since the work happens in the subprocesses
+        jobs = max(1, min(jobs, len(videos)))
+        batches = [videos[i::jobs] for i in range(jobs)]
+        print(f"[*] Downloading in {jobs} parallel batch(es)")
+        completed = failed = 0
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(self._download_batch, batch, use_title)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                ok, bad = future.result()
+                completed += ok
+                failed += bad
+        print(f"\n[+] Downloaded {completed}/{len(videos)} videos ({failed} failed)")
+
+    def _download_batch(self, videos, use_title=True):
+        """Download several videos with a single yt-dlp run fed by a batch file"""
+        output_dir = str(self.download_dir).replace("%", "%%")
+        name = "%(title).200B" if use_title else "%(id)s"
+        output_template = os.path.join(output_dir, f"{name}.%(ext)s")
+        # Several pending rows may share a video ID (e.g. URLs differing only in
+        # query params); every one of them gets the outcome of that ID
+        urls_by_id = {}
+        for db_id, url, vid_id in videos:
+            urls_by_id.setdefault(vid_id, []).append(url)
+
+        done = set()
+        errors = {}
+        process = None
+        batch_fd, batch_path = tempfile.mkstemp(suffix=".txt", text=True)
+        try:
+            with os.fdopen(batch_fd, "w") as f:
+                f.write("\n".join(url for db_id, url, vid_id in videos) + "\n")
 
+            cmd = [
+                "yt-dlp",
+                "-a",
+                batch_path,
+                "-f",
+                "mp4",
+                "-o",
+                output_template,
+                "--print",
+                f"after_move:{DONE_MARKER}%(id)s\t%(title)s\t%(filepath)s",
+                "--concurrent-fragments",
+                str(self.concurrent_fragments),
+                "--http-chunk-size",
+                "10M",
+                "--progress",
+                "--newline",
+            ]
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=64 * 1024,
+            )
+            done_marker = DONE_MARKER.encode()
+            error_marker = b"ERROR:"
+            sys.stdout.flush()
+            for raw in iter(process.stdout.readline, b""):
+                if raw.startswith(done_marker):
+                    line = self._decode_output(raw[len(done_marker) :])
+                    fields = line.split("\t")
+                    vid_id, title, path = fields[0], "\t".join(fields[1:-1]), fields[-1]
+                    if vid_id in urls_by_id and vid_id not in done:
+                        # Record each video as it finishes so progress survives
+                        # an interrupted run and shows up in --list meanwhile
+                        done.add(vid_id)
+                        self._update_video_statuses(
+                            [(path, title, url) for url in urls_by_id[vid_id]], []
+                        )
+                        print(f"[+] Downloaded: {path}", flush=True)
+                    continue
+                if raw.startswith(error_marker):
+                    line = self._decode_output(raw)
+                    match = YTDLP_ERROR_RE.match(line)
+                    if match and match.group(1) in urls_by_id:
+                        errors[match.group(1)] = line[:500]
+                self._echo_output(raw)
+            process.wait()
+        except Exception as e:
+            self._stop_process(process)
+            print(f"\n[-] Error: {str(e)[:500]}")
+        finally:
+            os.remove(batch_path)
+
+        # Only videos with their own ERROR line failed; anything yt-dlp never
+        # got to (interrupted or aborted run) stays pending for a later retry
+        failed = [
+            (error, url)
+            for vid_id, error in errors.items()
+            if vid_id not in done
+            for url in urls_by_id[vid_id]
+        ]
+        self._update_video_statuses([], failed)
+
+        completed = sum(len(urls_by_id[vid_id]) for vid_id in done)
+        left = len(videos) - completed - len(failed)
+        if left:
+            print(f"[!] {left} video(s) not attempted, left pending")
+        return completed, len(failed)
+
+    def list_videos(self, status=None, limit=None, offset=0):
+        """List videos from database, optionally paginated with limit/offset"""
+        c = self.conn.cursor()
+
+        # Only fetch the columns that are displayed; LIMIT -1 means no limit
+        query = "SELECT id, status, title, video_url FROM videos"
+        params = []
         if status:
-            c.execute("SELECT * FROM videos WHERE status=?", (status,))
-        else:
-            c.execute("SELECT * FROM videos")
+            query += " WHERE status=?"
+            params.append(status)
+        query += " ORDER BY id LIMIT ? OFFSET ?"
+        params += [limit if limit is not None else -1, offset]
+        c.execute(query, params)
 
         videos = c.fetchall()
-        conn.close()
 
         if not videos:
             print(
@@ -346,20 +674,7 @@ class YTDownloader:
 
         print(f"\n{'ID':<5} {'Status':<12} {'Title':<50} {'URL':<40}")
         print("=" * 120)
-        for v in videos:
-            (
-                vid_id,
-                url,
-                video_id,
-                title,
-                channel,
-                status,
-                path,
-                custom,
-                scraped,
-                downloaded,
-                error,
-            ) = v
+        for vid_id, status, title, url in videos:
             title_display = (
                 (title or "N/A")[:47] + "..."
                 if title and len(title) > 50
@@ -371,8 +686,7 @@ class YTDownloader:
 
     def delete_videos(self, status, skip_confirmation=False):
         """Delete videos from database by status"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
 
         if status == "all":
             c.execute("SELECT COUNT(*) FROM videos")
@@ -383,7 +697,6 @@ class YTDownloader:
 
         if count == 0:
             print(f"[!] No videos found with status '{status}'")
-            conn.close()
             return
 
         if not skip_confirmation:
@@ -391,19 +704,27 @@ class YTDownloader:
             choice = input("Are you sure? This cannot be undone. [y/N]: ").lower()
             if choice != "y":
                 print("[-] Deletion aborted.")
-                conn.close()
                 return
 
         if status == "all":
             c.execute("DELETE FROM videos")
         else:
             c.execute("DELETE FROM videos WHERE status=?", (status,))
-        
-        conn.commit()
-        conn.close()
+
         print(f"[+] Successfully deleted {count} videos.")
 
 
+def positive_int(value):
+    """argparse type for options that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="YouTube Channel Bulk Video Downloader"
@@ -423,6 +744,17 @@ def main():
         choices=["all", "pending", "completed", "failed"],
         help="List videos by status",
     )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Maximum number of videos to show with --list",
+    )
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="Number of videos to skip with --list (default: 0)",
+    )
     parser.add_argument(
         "--delete",
         choices=["all", "pending", "completed", "failed"],
@@ -445,6 +777,19 @@ def main():
         action="store_true",
         help="Skip confirmation prompt",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=4,
+        help="Number of yt-dlp batch processes to run in parallel (default: 4)",
+    )
+    parser.add_argument(
+        "--fragments",
+        type=positive_int,
+        default=4,
+        help="Fragments yt-dlp downloads concurrently per video (default: 4)",
+    )
     parser.add_argument(
         "--db",
         default="database.sqlite",
@@ -459,67 +804,71 @@ def main():
 
     args = parser.parse_args()
 
-    downloader = YTDownloader(db_path=args.db, download_dir=args.output)
-
-    if args.scrape:
-        if not args.channel:
-            print("[-] Error: --channel required for scraping")
-            sys.exit(1)
-
-        urls = downloader.scrape_channel_videos(args.channel)
-        downloader.add_videos_to_db(urls, args.channel)
+    with YTDownloader(
+        db_path=args.db, download_dir=args.output, concurrent_fragments=args.fragments
+    ) as downloader:
+        if args.scrape:
+            if not args.channel:
+                print("[-] Error: --channel required for scraping")
+                sys.exit(1)
+
+            urls = downloader.scrape_channel_videos(args.channel)
+            downloader.add_videos_to_db(urls, args.channel)
+
+        if args.video:
+            video_url = args.video
+            video_id = downloader._extract_video_id(video_url)
+            if video_id:
+                downloader.add_videos_to_db([(video_url, video_id)], "Single Video")
+                use_title = not args.use_id
+                custom_name = None
+                if args.interactive:
+                    choice = input("Use video title as filename? (y/n/custom): ").lower()
+                    if choice == "n":
+                        use_title = False
+                    elif choice == "custom":
+                        custom_name = input("Enter custom filename (without extension): ")
+                downloader.download_video(video_id, video_url, custom_name, use_title)
+            else:
+                print(f"[-] Invalid YouTube video URL: {args.video}")
+                sys.exit(1)
+
+        if args.playlist:
+            playlist_url = args.playlist
+            urls = downloader.scrape_playlist_videos(playlist_url)
+            if urls:
+                pending = downloader.add_videos_to_db(urls, playlist_url)
+                print(
+                    f"[*] Starting download for {len(urls)} videos from playlist: {playlist_url}"
+                )
+                use_title = not args.use_id
+                downloader.download_all_pending(
+                    use_title=use_title,
+                    interactive=args.interactive,
+                    channel_url=playlist_url,
+                    skip_confirmation=args.yes,
+                    jobs=args.jobs,
+                    videos=pending,
+                )
 
-    if args.video:
-        video_url = args.video
-        video_id = downloader._extract_video_id(video_url)
-        if video_id:
-            downloader.add_videos_to_db([video_url], "Single Video")
-            use_title = not args.use_id
-            custom_name = None
-            if args.interactive:
-                choice = input("Use video title as filename? (y/n/custom): ").lower()
-                if choice == "n":
-                    use_title = False
-                elif choice == "custom":
-                    custom_name = input("Enter custom filename (without extension): ")
-            downloader.download_video(video_id, video_url, custom_name, use_title)
-        else:
-            print(f"[-] Invalid YouTube video URL: {args.video}")
-            sys.exit(1)
-
-    if args.playlist:
-        playlist_url = args.playlist
-        urls = downloader.scrape_playlist_videos(playlist_url)
-        if urls:
-            downloader.add_videos_to_db(urls, playlist_url)
-            print(
-                f"[*] Starting download for {len(urls)} videos from playlist: {playlist_url}"
-            )
+        if args.download:
             use_title = not args.use_id
             downloader.download_all_pending(
                 use_title=use_title,
                 interactive=args.interactive,
-                channel_url=playlist_url,
                 skip_confirmation=args.yes,
+                jobs=args.jobs,
             )
 
-    if args.download:
-        use_title = not args.use_id
-        downloader.download_all_pending(
-            use_title=use_title,
-            interactive=args.interactive,
-            skip_confirmation=args.yes,
-        )
-
-    if args.list:
-        status = None if args.list == "all" else args.list
-        downloader.list_videos(status=status)
+        if args.list:
+            status = None if args.list == "all" else args.list
+            downloader.list_videos(status=status, limit=args.limit, offset=args.offset)
 
-    if args.delete:
-        downloader.delete_videos(args.delete, skip_confirmation=args.yes)
+        if args.delete:
+            downloader.delete_videos(args.delete, skip_confirmation=args.yes)
 
-    if not any([args.scrape, args.download, args.list, args.video, args.playlist, args.delete]):
-        parser.print_help()
+        if not any([args.scrape, args.download, args.list, args.video, args.playlist, args.delete]):
+            parser.print_help()
 
 
 if __name__ == "__main__":